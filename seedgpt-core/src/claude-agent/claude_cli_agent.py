@@ -7,6 +7,7 @@ Provides a Python interface to interact with Claude CLI in headless mode
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
 import sys
@@ -28,6 +29,13 @@ from utils.exceptions import (
 
 logger = get_logger(__name__)
 
+# orjson parses large CLI responses several times faster than the
+# stdlib; fall back silently when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class ClaudeAgent:
     """
@@ -73,15 +81,22 @@ class ClaudeAgent:
         else:
             logger.warning("Claude CLI not available, but not required")
 
+    # Cached result of the CLI probe, shared across instances so each
+    # process shells out to `claude --version` at most once.
+    _cli_probe_result: Optional[bool] = None
+
     def _is_claude_installed(self) -> bool:
-        """Check if claude CLI is installed."""
-        try:
-            subprocess.run(["claude", "--version"], capture_output=True, check=True)
-            logger.debug("Claude CLI is installed and available")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            logger.debug(f"Claude CLI not found: {e}")
-            return False
+        """Check if claude CLI is installed (probed once per process)."""
+        cls = type(self)
+        if cls._cli_probe_result is None:
+            try:
+                subprocess.run(["claude", "--version"], capture_output=True, check=True)
+                logger.debug("Claude CLI is installed and available")
+                cls._cli_probe_result = True
+            except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                logger.debug(f"Claude CLI not found: {e}")
+                cls._cli_probe_result = False
+        return cls._cli_probe_result
 
     def _build_command(
         self, prompt: str, additional_args: Optional[List[str]] = None
@@ -231,10 +246,10 @@ class ClaudeAgent:
 
                 if self.output_format == "json":
                     try:
-                        result = json.loads(stdout_text)
+                        result = _json_loads(stdout_text)
                         logger.info("Successfully parsed JSON response")
                         return result
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         logger.error(f"Failed to parse JSON response: {e}")
                         raise JSONParseError(stdout_text, str(e))
                 else:
@@ -309,10 +324,10 @@ class ClaudeAgent:
 
                 if self.output_format == "json":
                     try:
-                        result_data = json.loads(result.stdout)
+                        result_data = _json_loads(result.stdout)
                         logger.info("Successfully parsed JSON response")
                         return result_data
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         logger.error(f"Failed to parse JSON response: {e}")
                         raise JSONParseError(result.stdout, str(e))
                 else:
@@ -369,10 +384,10 @@ class ClaudeAgent:
 
             if self.output_format == "json":
                 try:
-                    result_data = json.loads(result.stdout)
+                    result_data = _json_loads(result.stdout)
                     logger.info("Successfully parsed JSON response from stdin query")
                     return result_data
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     logger.error(f"Failed to parse JSON response: {e}")
                     raise JSONParseError(result.stdout, str(e))
             else:
@@ -419,10 +434,10 @@ class ClaudeAgent:
 
             if self.output_format == "json":
                 try:
-                    result_data = json.loads(result.stdout)
+                    result_data = _json_loads(result.stdout)
                     logger.info("Successfully parsed JSON response from continued conversation")
                     return result_data
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     logger.error(f"Failed to parse JSON response: {e}")
                     raise JSONParseError(result.stdout, str(e))
             else:
@@ -563,23 +578,32 @@ class ClaudeAgent:
         return result
 
     def batch_process(
-        self, directory: str, prompt: str, file_pattern: str = "*.py"
+        self,
+        directory: str,
+        prompt: str,
+        file_pattern: str = "*.py",
+        max_workers: int = 4,
     ) -> List[Dict[str, Any]]:
         """
         Process multiple files in a directory.
 
+        Files are processed concurrently on a bounded thread pool: each
+        query spawns its own claude subprocess, so fanning out overlaps
+        the process startup and network round-trips instead of paying
+        them serially per file.
+
         Args:
             directory: Directory to process
             prompt: Prompt to apply to each file
             file_pattern: Glob pattern for files to process
+            max_workers: Maximum number of files processed concurrently
 
         Returns:
-            List of results for each file
+            List of results for each file, in file-discovery order
         """
         logger.info(f"Starting batch processing in directory: {directory}")
         logger.debug(f"File pattern: {file_pattern}, Prompt: {prompt[:100]}...")
 
-        results = []
         path = Path(directory)
 
         if not path.exists():
@@ -592,33 +616,19 @@ class ClaudeAgent:
             logger.error(error_msg)
             raise FileOperationError(error_msg, details={"path": directory})
 
-        files_to_process = list(path.rglob(file_pattern))
+        files_to_process = [f for f in path.rglob(file_pattern) if f.is_file()]
         logger.info(f"Found {len(files_to_process)} files to process")
 
-        for file_path in files_to_process:
-            if file_path.is_file():
-                try:
-                    logger.debug(f"Processing file: {file_path}")
-                    with open(file_path, "r") as f:
-                        content = f.read()
-
-                    result = self.query_with_stdin(
-                        f"{prompt}\n\nFile: {file_path}", content
-                    )
-                    results.append(
-                        {"file": str(file_path), "result": result, "success": True}
-                    )
-                    logger.info(f"Successfully processed file: {file_path}")
-                except SeedGPTException as e:
-                    logger.warning(f"Failed to process file {file_path}: {e.message}")
-                    results.append(
-                        {"file": str(file_path), "error": e.message, "success": False}
-                    )
-                except Exception as e:
-                    logger.warning(f"Unexpected error processing file {file_path}: {str(e)}")
-                    results.append(
-                        {"file": str(file_path), "error": str(e), "success": False}
+        results = []
+        if files_to_process:
+            workers = min(max_workers, len(files_to_process))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda file_path: self._process_single_file(file_path, prompt),
+                        files_to_process,
                     )
+                )
 
         successful = sum(1 for r in results if r["success"])
         failed = len(results) - successful
@@ -626,6 +636,32 @@ class ClaudeAgent:
 
         return results
 
+    def _process_single_file(self, file_path: Path, prompt: str) -> Dict[str, Any]:
+        """
+        Process one file for batch_process, capturing failures per file.
+
+        Args:
+            file_path: File to read and send to Claude
+            prompt: Prompt to apply to the file
+
+        Returns:
+            Result dict with file, success flag and result or error
+        """
+        try:
+            logger.debug(f"Processing file: {file_path}")
+            with open(file_path, "r") as f:
+                content = f.read()
+
+            result = self.query_with_stdin(f"{prompt}\n\nFile: {file_path}", content)
+            logger.info(f"Successfully processed file: {file_path}")
+            return {"file": str(file_path), "result": result, "success": True}
+        except SeedGPTException as e:
+            logger.warning(f"Failed to process file {file_path}: {e.message}")
+            return {"file": str(file_path), "error": e.message, "success": False}
+        except Exception as e:
+            logger.warning(f"Unexpected error processing file {file_path}: {str(e)}")
+            return {"file": str(file_path), "error": str(e), "success": False}
+
 
 def main():
     """Example usage of ClaudeAgent."""
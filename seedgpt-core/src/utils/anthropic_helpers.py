@@ -11,6 +11,19 @@ from utils.retry import retry_anthropic_api
 
 logger = get_logger(__name__)
 
+# Clients are cached per API key so repeated calls reuse the underlying
+# HTTP connection pool (TLS handshakes and connection setup are paid
+# once per key instead of once per request).
+_clients = {}
+
+
+def _get_client(api_key: str) -> Anthropic:
+    """Return a cached Anthropic client for the given API key"""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = Anthropic(api_key=api_key)
+    return client
+
 
 @retry_anthropic_api
 def call_anthropic_api(
@@ -33,8 +46,8 @@ def call_anthropic_api(
     Returns:
         str: Response text from the API
     """
-    client = Anthropic(api_key=api_key)
-    
+    client = _get_client(api_key)
+
     kwargs = {
         "model": model,
         "max_tokens": max_tokens,
@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+Project Analyzer - Repository structure and technology detection
+
+Builds a structural picture of a GitHub repository (directories, file
+types, code patterns, documentation, testing, CI/CD and technology
+stack) that agents can feed into their prompts as context.
+
+The whole analysis is driven by a single recursive Git Trees API call
+instead of walking the repository directory-by-directory with
+``get_contents``, so the network cost is one round-trip regardless of
+how many directories the repository contains. The API returns a flat
+entry list, so no section ever recurses into subdirectories — iteration
+stays linear and is safe on arbitrarily deep repositories.
+"""
+
+import base64
+import functools
+import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from github import GithubException
+
+from logging_config import get_logger
+from utils.retry import retry_github_api
+
+logger = get_logger(__name__)
+
+# Code-pattern markers and the flag each one sets. Compiled into one
+# alternation so each sampled file is scanned in a single linear pass
+# instead of one substring search per marker.
+_PATTERN_TAGS = {
+    "class ": "has_classes",
+    "async def": "has_async",
+    "await ": "has_async",
+    "->": "has_type_hints",
+    ": str": "has_type_hints",
+    ": int": "has_type_hints",
+    "test_": "has_tests",
+    "Test": "has_tests",
+    "Factory": "factory",
+    "factory": "factory",
+    "Singleton": "singleton",
+    "Observer": "observer",
+    "observer": "observer",
+}
+_DESIGN_PATTERN_TAGS = frozenset({"factory", "singleton", "observer"})
+_CODE_PATTERN_RE = re.compile("|".join(map(re.escape, _PATTERN_TAGS)))
+
+
+def _memoized_section(section: str):
+    """
+    Cache a per-section analyzer result on the instance.
+
+    Results live in ``self._analysis_cache`` and are invalidated when
+    the repository head SHA changes (see ``_refresh_cache_key``).
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            cache = self._analysis_cache
+            if section not in cache:
+                cache[section] = method(self)
+            return cache[section]
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass
+class _TreeScan:
+    """Accumulators filled by a single pass over the flat tree list"""
+
+    dirs: List[str] = field(default_factory=list)
+    key_dir_hits: Set[str] = field(default_factory=set)
+    file_counts: Counter = field(default_factory=Counter)
+    total_files: int = 0
+    tree_paths: Set[str] = field(default_factory=set)
+
+
+# Source extensions mapped to language names, built once at import.
+LANGUAGE_MAP = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".jsx": "JavaScript",
+    ".java": "Java",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".c": "C",
+    ".cpp": "C++",
+    ".cs": "C#",
+}
+_LANGUAGE_EXTENSIONS = frozenset(LANGUAGE_MAP)
+
+# Trigger files for technology detection, hoisted so each call only does
+# hashed lookups against the cached tree paths.
+KEY_FILES = {
+    "package.json": "Node.js",
+    "requirements.txt": "Python",
+    "setup.py": "Python",
+    "pyproject.toml": "Python",
+    "Gemfile": "Ruby",
+    "pom.xml": "Java",
+    "build.gradle": "Java",
+    "go.mod": "Go",
+    "Cargo.toml": "Rust",
+}
+CONTAINER_FILES = {
+    "Dockerfile": "Docker",
+    "docker-compose.yml": "Docker Compose",
+}
+NODE_FRAMEWORK_MAP = {
+    "react": "React",
+    "next": "Next.js",
+    "vue": "Vue.js",
+    "express": "Express",
+}
+PYTHON_FRAMEWORK_MAP = {
+    "django": "Django",
+    "flask": "Flask",
+    "fastapi": "FastAPI",
+}
+
+# Directory names worth surfacing in the structure section.
+KEY_DIR_NAMES = frozenset({"src", "tests", "docs", "scripts", ".github", "config"})
+
+# On-disk cache of full analysis results, keyed by repository and head
+# SHA so repeated runs against the same commit skip all GitHub I/O.
+_DISK_CACHE_DIR = Path.home() / ".cache" / "ai-project-template" / "analysis"
+
+
+class ProjectAnalyzer:
+    """
+    Analyzes a GitHub repository's structure and technology stack.
+
+    Uses the Git Trees API with ``recursive=True`` to fetch the entire
+    repository tree in one request; all per-section analyzers iterate
+    over that cached flat list of entries.
+    """
+
+    def __init__(self, repo):
+        """
+        Initialize the Project Analyzer
+
+        Args:
+            repo: PyGithub Repository object
+        """
+        self.repo = repo
+        self._tree = None
+        self._analysis_cache: Dict[str, object] = {}
+        self._cache_sha: Optional[str] = None
+
+    @retry_github_api
+    def _get_tree(self) -> List:
+        """
+        Fetch the full repository tree once and cache it.
+
+        Returns:
+            List: Flat list of GitTreeElement entries (path, type, sha)
+        """
+        if self._tree is None:
+            git_tree = self.repo.get_git_tree(
+                self.repo.default_branch, recursive=True
+            )
+            if git_tree.truncated:
+                logger.warning(
+                    "Repository tree was truncated by the API; "
+                    "analysis may be incomplete"
+                )
+            self._tree = git_tree.tree
+            logger.debug(f"Fetched repository tree ({len(self._tree)} entries)")
+        return self._tree
+
+    @retry_github_api
+    def _refresh_cache_key(self) -> None:
+        """
+        Invalidate cached results when the repository head has moved.
+
+        Fetches the head SHA once; if it differs from the SHA the cache
+        was built against, both the tree and the per-section results are
+        dropped so the next access re-fetches.
+        """
+        head_sha = self.repo.get_branch(self.repo.default_branch).commit.sha
+        if head_sha != self._cache_sha:
+            if self._cache_sha is not None:
+                logger.debug(
+                    f"Head moved from {self._cache_sha} to {head_sha}; "
+                    "discarding cached analysis"
+                )
+            self._cache_sha = head_sha
+            self._tree = None
+            self._analysis_cache = {}
+
+    def analyze_project(self) -> Dict:
+        """
+        Run the full project analysis
+
+        Results are memoized per head SHA: repeated calls within the
+        same process re-issue no GitHub requests until the default
+        branch advances.
+
+        Returns:
+            Dict: Analysis results keyed by section
+        """
+        self._refresh_cache_key()
+
+        cached = self._load_cached_analysis()
+        if cached is not None:
+            logger.debug(
+                f"Using cached analysis for {self.repo.full_name}@{self._cache_sha}"
+            )
+            return cached
+
+        logger.info(f"Analyzing project structure for {self.repo.full_name}")
+
+        # Fetch the tree up front so the section threads share one copy
+        # instead of racing to populate it.
+        self._get_tree()
+
+        sections = {
+            "directory_structure": self._analyze_directory_structure,
+            "file_types": self._analyze_file_types,
+            "code_patterns": self._analyze_code_patterns,
+            "documentation": self._analyze_documentation,
+            "testing": self._analyze_testing_setup,
+            "ci_cd": self._analyze_ci_cd,
+            "technology_stack": self._detect_technology_stack,
+        }
+
+        # Each section is independent and I/O-bound on GitHub latency,
+        # so run them concurrently and assemble results in order.
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {
+                name: executor.submit(method) for name, method in sections.items()
+            }
+            analysis = {name: future.result() for name, future in futures.items()}
+
+        self._store_cached_analysis(analysis)
+        logger.info("Project analysis completed")
+        return analysis
+
+    def _disk_cache_path(self) -> Path:
+        """Cache file for the current repository and head SHA"""
+        safe_name = self.repo.full_name.replace("/", "__")
+        return _DISK_CACHE_DIR / f"{safe_name}__{self._cache_sha}.json"
+
+    def _load_cached_analysis(self) -> Optional[Dict]:
+        """Return the analysis cached on disk for this head, if any"""
+        cache_path = self._disk_cache_path()
+        try:
+            if cache_path.exists():
+                return json.loads(cache_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+        return None
+
+    def _store_cached_analysis(self, analysis: Dict) -> None:
+        """Write the analysis to the disk cache; failures are non-fatal"""
+        cache_path = self._disk_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(analysis))
+        except (OSError, TypeError) as e:
+            logger.debug(f"Could not write analysis cache {cache_path}: {e}")
+
+    @_memoized_section("tree_scan")
+    def _scan_tree(self) -> _TreeScan:
+        """
+        Walk the flat tree list once, filling every accumulator the
+        structural sections need.
+
+        The directory, file-type and technology-stack sections all used
+        to iterate the tree independently; they are now thin formatters
+        over this shared single-pass result.
+        """
+        scan = _TreeScan()
+
+        for entry in self._get_tree():
+            scan.tree_paths.add(entry.path)
+            if entry.type == "tree":
+                scan.dirs.append(entry.path)
+                # Tree entries carry only the full path; rpartition is
+                # cheaper than os.path.basename for the final component.
+                base_name = entry.path.rpartition("/")[2]
+                if base_name in KEY_DIR_NAMES:
+                    scan.key_dir_hits.add(base_name)
+            elif entry.type == "blob":
+                scan.total_files += 1
+                _, ext = os.path.splitext(entry.path)
+                if ext:
+                    scan.file_counts[ext] += 1
+
+        return scan
+
+    @_memoized_section("directory_structure")
+    def _analyze_directory_structure(self) -> Dict:
+        """Analyze top-level layout and presence of key directories"""
+        scan = self._scan_tree()
+
+        return {
+            "directories": scan.dirs,
+            "directory_count": len(scan.dirs),
+            "key_directories": {
+                name: name in scan.key_dir_hits for name in KEY_DIR_NAMES
+            },
+            "has_src": "src" in scan.key_dir_hits,
+            "has_tests": "tests" in scan.key_dir_hits,
+            "has_docs": "docs" in scan.key_dir_hits,
+        }
+
+    @_memoized_section("file_types")
+    def _analyze_file_types(self) -> Dict:
+        """Count files by extension and determine the primary language"""
+        scan = self._scan_tree()
+
+        top_types = dict(scan.file_counts.most_common(10))
+
+        return {
+            "file_counts": top_types,
+            "total_files": scan.total_files,
+            "primary_language": self._determine_primary_language(scan.file_counts),
+        }
+
+    @_memoized_section("code_patterns")
+    def _analyze_code_patterns(self) -> Dict:
+        """Scan every Python file in the tree for common code patterns"""
+        patterns = {
+            "has_classes": False,
+            "has_async": False,
+            "has_type_hints": False,
+            "has_tests": False,
+            "design_patterns": [],
+        }
+
+        py_blobs = [
+            (entry.path, entry.sha)
+            for entry in self._get_tree()
+            if entry.type == "blob" and entry.path.endswith(".py")
+        ]
+        if not py_blobs:
+            return patterns
+
+        # Blobs are fetched by SHA in parallel; each worker returns the
+        # tags it saw and the merge happens on the calling thread.
+        with ThreadPoolExecutor(max_workers=min(16, len(py_blobs))) as executor:
+            for tags in executor.map(self._fetch_and_scan_blob, py_blobs):
+                for tag in tags:
+                    if tag in _DESIGN_PATTERN_TAGS:
+                        if tag not in patterns["design_patterns"]:
+                            patterns["design_patterns"].append(tag)
+                    else:
+                        patterns[tag] = True
+
+        return patterns
+
+    def _fetch_and_scan_blob(self, path_and_sha) -> frozenset:
+        """Fetch one blob by SHA and return the pattern tags it contains"""
+        path, sha = path_and_sha
+        try:
+            blob = self._get_blob(sha)
+            code = base64.b64decode(blob.content).decode("utf-8", errors="replace")
+        except GithubException as e:
+            if e.status == 404:
+                logger.debug(f"Blob for {path} not found")
+            else:
+                logger.warning(f"Could not fetch blob for {path}: {e}")
+            return frozenset()
+        return self._scan_python_source(code)
+
+    @retry_github_api
+    def _get_blob(self, sha: str):
+        """Fetch a single git blob with rate-limit-aware retries"""
+        return self.repo.get_git_blob(sha)
+
+    @staticmethod
+    def _scan_python_source(code: str) -> frozenset:
+        """Return the pattern tags present in a Python source string"""
+        return frozenset(
+            _PATTERN_TAGS[match.group()]
+            for match in _CODE_PATTERN_RE.finditer(code)
+        )
+
+    @_memoized_section("documentation")
+    def _analyze_documentation(self) -> Dict:
+        """Check for standard documentation files at the repository root"""
+        top_blobs = set()
+        top_trees = set()
+        doc_files = []
+
+        for entry in self._get_tree():
+            if "/" in entry.path:
+                continue
+            name_lower = entry.path.lower()
+            if entry.type == "tree":
+                top_trees.add(name_lower)
+            else:
+                top_blobs.add(name_lower)
+                if name_lower.endswith(".md"):
+                    doc_files.append(entry.path)
+
+        # Presence flags are set intersections rather than per-entry
+        # branch chains.
+        return {
+            "has_readme": bool(top_blobs & {"readme.md", "readme"}),
+            "has_contributing": "contributing.md" in top_blobs,
+            "has_changelog": bool(top_blobs & {"changelog.md", "changelog"}),
+            "has_license": bool(top_blobs & {"license", "license.md", "license.txt"}),
+            "has_docs_folder": "docs" in top_trees,
+            "doc_files": doc_files,
+        }
+
+    @_memoized_section("testing")
+    def _analyze_testing_setup(self) -> Dict:
+        """Detect the testing layout and configuration"""
+        testing = {
+            "has_test_directory": False,
+            "test_files": [],
+            "has_pytest_config": False,
+            "has_tox_config": False,
+        }
+
+        for entry in self._get_tree():
+            base_name = entry.path.rpartition("/")[2]
+            if entry.type == "tree":
+                if base_name in ("tests", "test"):
+                    testing["has_test_directory"] = True
+            elif base_name.startswith("test_") and base_name.endswith(".py"):
+                testing["test_files"].append(entry.path)
+            elif base_name in ("pytest.ini", "setup.cfg", "pyproject.toml"):
+                testing["has_pytest_config"] = True
+            elif base_name == "tox.ini":
+                testing["has_tox_config"] = True
+
+        testing["test_file_count"] = len(testing["test_files"])
+        return testing
+
+    @_memoized_section("ci_cd")
+    def _analyze_ci_cd(self) -> Dict:
+        """Inspect GitHub Actions workflows"""
+        ci_cd = {
+            "has_github_actions": False,
+            "workflow_files": [],
+            "has_deployment": False,
+        }
+
+        workflow_paths = [
+            entry.path
+            for entry in self._get_tree()
+            if entry.type == "blob"
+            and entry.path.startswith(".github/workflows/")
+            and entry.path.endswith((".yml", ".yaml"))
+        ]
+
+        if not workflow_paths:
+            return ci_cd
+
+        ci_cd["has_github_actions"] = True
+        ci_cd["workflow_files"] = workflow_paths
+
+        # Workflow bodies are independent fetches, so batch them on a
+        # thread pool and grep the texts in memory.
+        with ThreadPoolExecutor(max_workers=len(workflow_paths)) as executor:
+            for content in executor.map(self._fetch_file_text, workflow_paths):
+                if content is not None and "deploy" in content.lower():
+                    ci_cd["has_deployment"] = True
+                    break
+
+        return ci_cd
+
+    @_memoized_section("technology_stack")
+    def _detect_technology_stack(self) -> Dict:
+        """Identify languages, frameworks and tooling from trigger files"""
+        tech_stack = {
+            "languages": [],
+            "frameworks": [],
+            "tools": [],
+        }
+
+        tree_paths = self._scan_tree().tree_paths
+
+        for file_name, language in KEY_FILES.items():
+            if file_name in tree_paths and language not in tech_stack["languages"]:
+                tech_stack["languages"].append(language)
+
+        for file_name, tool in CONTAINER_FILES.items():
+            if file_name in tree_paths:
+                tech_stack["tools"].append(tool)
+
+        # Only fetch the manifests that actually exist in the tree (no
+        # wasted 404 round-trips), and fetch them concurrently since
+        # each is an independent HTTP GET.
+        manifests = [
+            path
+            for path in ("package.json", "requirements.txt")
+            if path in tree_paths
+        ]
+        if manifests:
+            with ThreadPoolExecutor(max_workers=len(manifests)) as executor:
+                contents = dict(
+                    zip(manifests, executor.map(self._fetch_file_text, manifests))
+                )
+
+            if contents.get("package.json") is not None:
+                self._detect_node_frameworks(contents["package.json"], tech_stack)
+            if contents.get("requirements.txt") is not None:
+                self._detect_python_frameworks(contents["requirements.txt"], tech_stack)
+
+        return tech_stack
+
+    def _fetch_file_text(self, path: str) -> Optional[str]:
+        """Fetch and decode a single file, returning None on failure"""
+        try:
+            return self._get_file_contents(path).decoded_content.decode("utf-8")
+        except GithubException as e:
+            if e.status == 404:
+                logger.debug(f"{path} not found")
+            else:
+                logger.warning(f"Could not fetch {path}: {e}")
+            return None
+
+    @retry_github_api
+    def _get_file_contents(self, path: str):
+        """Fetch a single file's contents with rate-limit-aware retries"""
+        return self.repo.get_contents(path)
+
+    @staticmethod
+    def _detect_node_frameworks(text: str, tech_stack: Dict) -> None:
+        """Detect Node.js frameworks from package.json content"""
+        try:
+            package_data = json.loads(text)
+        except ValueError as e:
+            logger.debug(f"Could not parse package.json: {e}")
+            return
+
+        deps = {
+            **package_data.get("dependencies", {}),
+            **package_data.get("devDependencies", {}),
+        }
+        for dep, label in NODE_FRAMEWORK_MAP.items():
+            if dep in deps:
+                tech_stack["frameworks"].append(label)
+
+    @staticmethod
+    def _detect_python_frameworks(text: str, tech_stack: Dict) -> None:
+        """Detect Python frameworks from requirements.txt content"""
+        text_lower = text.lower()
+        for marker, label in PYTHON_FRAMEWORK_MAP.items():
+            if marker in text_lower:
+                tech_stack["frameworks"].append(label)
+
+    @staticmethod
+    def _determine_primary_language(file_types: Dict) -> str:
+        """Map the most common known source extension to a language name"""
+        candidates = _LANGUAGE_EXTENSIONS & file_types.keys()
+        if not candidates:
+            return "Unknown"
+        return LANGUAGE_MAP[max(candidates, key=file_types.__getitem__)]
+
+    def generate_context_summary(self) -> str:
+        """
+        Generate a human-readable summary for agent prompts
+
+        Returns:
+            str: Multi-line summary of the analysis
+        """
+        analysis = self.analyze_project()
+
+        structure = analysis["directory_structure"]
+        file_types = analysis["file_types"]
+        tech = analysis["technology_stack"]
+
+        lines = [
+            f"Repository: {self.repo.full_name}",
+            f"Primary language: {file_types['primary_language']}",
+            f"Total files: {file_types['total_files']}",
+            f"Directories: {structure['directory_count']}",
+        ]
+
+        if tech["languages"]:
+            lines.append(f"Languages: {', '.join(tech['languages'])}")
+        if tech["frameworks"]:
+            lines.append(f"Frameworks: {', '.join(tech['frameworks'])}")
+        if tech["tools"]:
+            lines.append(f"Tools: {', '.join(tech['tools'])}")
+
+        lines.append(f"Has tests: {analysis['testing']['has_test_directory']}")
+        lines.append(f"Has CI/CD: {analysis['ci_cd']['has_github_actions']}")
+
+        return "\n".join(lines)
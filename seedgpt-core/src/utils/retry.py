@@ -15,33 +15,55 @@ a robust and battle-tested retry library that provides:
 """
 
 import functools
+import inspect
 import logging
-from typing import Callable, Type, Tuple, Optional, Union
+import math
+import random
+import re
+import threading
+import time
+from typing import Callable, Dict, Type, Tuple, Optional
 
 from tenacity import (
     retry,
     stop_after_attempt,
+    stop_after_delay,
     wait_exponential,
-    wait_fixed,
     retry_if_exception_type,
     before_sleep_log,
-    after_log,
-    RetryError,
     TryAgain,
 )
 from tenacity.wait import wait_base
-from tenacity.stop import stop_base
 
 from logging_config import get_logger
-from utils.exceptions import (
-    RateLimitError as SeedGPTRateLimitError,
-    RetryExhaustedError,
-    TimeoutError as SeedGPTTimeoutError,
-)
 
 # Get logger
 logger = get_logger(__name__)
 
+# Error-message classifiers, compiled once so each failed call costs a
+# single case-insensitive scan instead of one substring search per
+# keyword over a lowered copy of the message.
+_TRANSIENT_RE = re.compile(
+    r"timeout|timed out|connection|network|temporary|unavailable"
+    r"|503|502|429|rate limit|too many requests",
+    re.IGNORECASE,
+)
+_ANTHROPIC_RATE_LIMIT_RE = re.compile(
+    r"rate limit|429|too many requests", re.IGNORECASE
+)
+_ANTHROPIC_NETWORK_RE = re.compile(r"connection|timeout|network|503|502", re.IGNORECASE)
+_GITHUB_RATE_LIMIT_RE = re.compile(r"rate limit|403|abuse", re.IGNORECASE)
+_GITHUB_NETWORK_RE = re.compile(
+    r"connection|timeout|network|503|502|500", re.IGNORECASE
+)
+
+# Builtin exception types that always warrant a retry, bound once at
+# module scope instead of per classification call.
+_RETRYABLE_EXCEPTION_TYPES: Tuple[Type[Exception], ...] = (
+    ConnectionError,
+    TimeoutError,
+)
+
 
 class RetryConfig:
     """Configuration for retry behavior - maintained for backward compatibility"""
@@ -53,6 +75,8 @@ class RetryConfig:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         jitter: bool = True,
+        max_total_delay: Optional[float] = None,
+        strategy: str = "decorrelated",
     ):
         """
         Initialize retry configuration
@@ -62,13 +86,86 @@ class RetryConfig:
             base_delay: Initial delay between retries in seconds
             max_delay: Maximum delay between retries in seconds
             exponential_base: Base for exponential backoff calculation
-            jitter: Whether to add random jitter to delays
+            jitter: Whether to add random jitter to delays; False forces
+                the plain exponential curve
+            max_total_delay: Overall wall-clock budget in seconds across
+                all attempts; None leaves total time bounded only by
+                max_retries * max_delay
+            strategy: Wait curve — "decorrelated", "fibonacci" or
+                "exponential". Fibonacci grows ~1.618x per attempt,
+                fitting more retries into the same budget for services
+                that recover within seconds
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self.max_total_delay = max_total_delay
+        self.strategy = strategy
+
+
+class wait_decorrelated_jitter(wait_base):
+    """
+    Decorrelated jitter wait strategy: sleep = min(cap, uniform(base, prev * 3))
+
+    Unlike full jitter (uniform over [0, delay]), each wait is drawn
+    relative to the previous one, which breaks up synchronized retry
+    fleets without wasting attempts on near-zero sleeps.
+    """
+
+    def __init__(self, base: float = 1.0, cap: float = 60.0):
+        self.base = base
+        self.cap = cap
+
+    def __call__(self, retry_state) -> float:
+        previous = getattr(retry_state, "_previous_wait", self.base)
+        delay = min(self.cap, random.uniform(self.base, previous * 3))
+        retry_state._previous_wait = delay
+        return delay
+
+
+class wait_fibonacci(wait_base):
+    """
+    Fibonacci backoff: each wait is the sum of the previous two.
+
+    Grows by ~1.618x per attempt instead of doubling, which fits more
+    retries into the same total budget — useful against services whose
+    rate-limit windows clear within a few seconds.
+    """
+
+    def __init__(self, base: float = 1.0, cap: float = 60.0):
+        self.base = base
+        self.cap = cap
+
+    def __call__(self, retry_state) -> float:
+        current, following = getattr(
+            retry_state, "_fibonacci_pair", (self.base, self.base)
+        )
+        retry_state._fibonacci_pair = (following, current + following)
+        return min(current, self.cap)
+
+
+class wait_rate_limit_aware(wait_base):
+    """
+    Honor server-provided retry-after hints on top of a fallback strategy.
+
+    When the last failure was a RateLimitError carrying a retry_after
+    value parsed from the response, wait at least that long instead of
+    a blind backoff; otherwise defer to the wrapped strategy.
+    """
+
+    def __init__(self, fallback: wait_base, cap: float = 120.0):
+        self.fallback = fallback
+        self.cap = cap
+
+    def __call__(self, retry_state) -> float:
+        delay = self.fallback(retry_state)
+        outcome = retry_state.outcome
+        exception = outcome.exception() if outcome and outcome.failed else None
+        if isinstance(exception, RateLimitError) and exception.retry_after:
+            delay = max(delay, float(exception.retry_after))
+        return min(delay, self.cap)
 
 
 class RetryableError(Exception):
@@ -91,6 +188,84 @@ class NetworkError(RetryableError):
     pass
 
 
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited by an open circuit breaker"""
+
+    pass
+
+
+class RetryCancelled(Exception):
+    """Raised when a backoff wait is abandoned due to a shutdown request"""
+
+    pass
+
+
+# Shutdown signal shared by all retry loops in the process. time.sleep
+# cannot be interrupted from another thread, so backoff waits block on
+# this event instead and bail out as soon as it is set.
+_shutdown_event = threading.Event()
+
+
+def request_shutdown() -> None:
+    """Cancel all in-progress retry waits (e.g. from a SIGTERM handler)"""
+    _shutdown_event.set()
+
+
+def _interruptible_sleep(seconds: float) -> None:
+    """Sleep for the backoff period unless shutdown is requested first"""
+    if _shutdown_event.wait(seconds):
+        raise RetryCancelled("Retry wait cancelled by shutdown request")
+
+
+class CircuitBreaker:
+    """
+    Fast-fail calls to an upstream that has been failing repeatedly.
+
+    Failures are counted per key (typically the wrapped function's
+    qualified name). Once failure_threshold consecutive failures are
+    recorded, the circuit opens and calls fail immediately until
+    reset_timeout seconds have passed, at which point one call is let
+    through to probe the upstream.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failure_counts: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+
+    def is_available(self, key: str) -> bool:
+        """Check whether calls for this key may proceed"""
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at >= self.reset_timeout:
+                # Half-open: allow one probe through
+                del self._opened_at[key]
+                self._failure_counts[key] = self.failure_threshold - 1
+                return True
+            return False
+
+    def record_success(self, key: str) -> None:
+        """Reset the failure count after a successful call"""
+        with self._lock:
+            self._failure_counts.pop(key, None)
+            self._opened_at.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        """Count a failure and open the circuit at the threshold"""
+        with self._lock:
+            count = self._failure_counts.get(key, 0) + 1
+            self._failure_counts[key] = count
+            if count >= self.failure_threshold:
+                logger.warning(
+                    f"Circuit breaker opened for {key} after {count} failures"
+                )
+                self._opened_at[key] = time.monotonic()
+
+
 def should_retry_exception(exception: Exception) -> bool:
     """
     Determine if an exception should trigger a retry
@@ -106,26 +281,11 @@ def should_retry_exception(exception: Exception) -> bool:
         return True
 
     # Check for common retryable exception types
-    if isinstance(exception, (ConnectionError, TimeoutError)):
+    if isinstance(exception, _RETRYABLE_EXCEPTION_TYPES):
         return True
 
     # Check for specific error messages indicating transient failures
-    error_msg = str(exception).lower()
-    transient_indicators = [
-        "timeout",
-        "timed out",
-        "connection",
-        "network",
-        "temporary",
-        "unavailable",
-        "503",
-        "502",
-        "429",
-        "rate limit",
-        "too many requests",
-    ]
-
-    return any(indicator in error_msg for indicator in transient_indicators)
+    return bool(_TRANSIENT_RE.search(str(exception)))
 
 
 def classify_anthropic_exception(e: Exception) -> Exception:
@@ -138,10 +298,10 @@ def classify_anthropic_exception(e: Exception) -> Exception:
     Returns:
         Classified exception (RateLimitError, NetworkError, or original)
     """
-    error_msg = str(e).lower()
+    error_msg = str(e)
 
     # Check for rate limiting
-    if "rate limit" in error_msg or "429" in error_msg or "too many requests" in error_msg:
+    if _ANTHROPIC_RATE_LIMIT_RE.search(error_msg):
         # Try to extract retry-after if available
         retry_after = None
         # Check if exception has response headers
@@ -157,12 +317,9 @@ def classify_anthropic_exception(e: Exception) -> Exception:
         return RateLimitError(retry_after=retry_after)
 
     # Check for network errors
-    if any(
-        indicator in error_msg
-        for indicator in ["connection", "timeout", "network", "503", "502"]
-    ):
+    if _ANTHROPIC_NETWORK_RE.search(error_msg):
         logger.warning(f"Network error detected for Anthropic API: {error_msg[:100]}")
-        return NetworkError(str(e))
+        return NetworkError(error_msg)
 
     # Return original exception
     return e
@@ -178,10 +335,10 @@ def classify_github_exception(e: Exception) -> Exception:
     Returns:
         Classified exception (RateLimitError, NetworkError, or original)
     """
-    error_msg = str(e).lower()
+    error_msg = str(e)
 
     # Check for rate limiting (GitHub returns 403 for rate limits)
-    if "rate limit" in error_msg or "403" in error_msg or "abuse" in error_msg:
+    if _GITHUB_RATE_LIMIT_RE.search(error_msg):
         # Try to extract rate limit reset time from exception
         # GithubException often includes this info
         retry_after = None
@@ -193,21 +350,41 @@ def classify_github_exception(e: Exception) -> Exception:
         return RateLimitError(retry_after=retry_after)
 
     # Check for network errors
-    if any(
-        indicator in error_msg
-        for indicator in ["connection", "timeout", "network", "503", "502", "500"]
-    ):
+    if _GITHUB_NETWORK_RE.search(error_msg):
         logger.warning(f"Network error detected for GitHub API: {error_msg[:100]}")
-        return NetworkError(str(e))
+        return NetworkError(error_msg)
 
     # Return original exception
     return e
 
 
+def _build_wait(config: RetryConfig) -> wait_base:
+    """
+    Build the wait strategy for a retry configuration.
+
+    jitter=False always yields the plain exponential curve; otherwise
+    the config's strategy picks between decorrelated jitter (default),
+    fibonacci and exponential waits.
+    """
+    if config.jitter:
+        if config.strategy == "fibonacci":
+            return wait_fibonacci(base=config.base_delay, cap=config.max_delay)
+        if config.strategy == "decorrelated":
+            return wait_decorrelated_jitter(
+                base=config.base_delay, cap=config.max_delay
+            )
+    return wait_exponential(
+        multiplier=config.base_delay,
+        max=config.max_delay,
+        exp_base=config.exponential_base,
+    )
+
+
 def retry_with_backoff(
     config: Optional[RetryConfig] = None,
     retryable_exceptions: Tuple[Type[Exception], ...] = (Exception,),
     on_retry: Optional[Callable[[Exception, int, float], None]] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
 ):
     """
     Decorator to add retry logic with exponential backoff to a function
@@ -218,6 +395,9 @@ def retry_with_backoff(
         retryable_exceptions: Tuple of exception types to retry on
         on_retry: Optional callback function called before each retry
                   Signature: on_retry(exception, attempt, delay)
+        circuit_breaker: Optional CircuitBreaker consulted before each
+                  call; while open, calls raise CircuitOpenError without
+                  spending any retry budget
 
     Example:
         @retry_with_backoff(
@@ -231,44 +411,92 @@ def retry_with_backoff(
     if config is None:
         config = RetryConfig()
 
+    wait_strategy = _build_wait(config)
+
+    # Stop after max_retries attempts, and optionally once the overall
+    # wall-clock budget is spent (measured against a monotonic clock),
+    # whichever comes first.
+    stop_strategy = stop_after_attempt(config.max_retries + 1)
+    if config.max_total_delay is not None:
+        stop_strategy = stop_strategy | stop_after_delay(config.max_total_delay)
+
     def decorator(func: Callable) -> Callable:
-        # Create Tenacity retry decorator with exponential backoff
-        tenacity_decorator = retry(
-            # Stop after max_retries attempts
-            stop=stop_after_attempt(config.max_retries + 1),
-            # Exponential backoff with jitter
-            wait=wait_exponential(
-                multiplier=config.base_delay,
-                max=config.max_delay,
-                exp_base=config.exponential_base,
-            ),
+        # The before-sleep hook is assembled once at decoration time:
+        # with no callback it is just Tenacity's logger, so configs
+        # without on_retry pay nothing extra per retry.
+        before_sleep_handler = before_sleep_log(logger, logging.WARNING)
+        if on_retry is not None:
+            log_handler = before_sleep_handler
+
+            def before_sleep_handler(retry_state):
+                log_handler(retry_state)
+                try:
+                    on_retry(
+                        retry_state.outcome.exception(),
+                        retry_state.attempt_number,
+                        retry_state.next_action.sleep,
+                    )
+                except Exception as callback_error:
+                    logger.warning(f"on_retry callback failed: {callback_error}")
+
+        tenacity_kwargs = dict(
+            stop=stop_strategy,
+            wait=wait_strategy,
             # Retry on specified exceptions
             retry=retry_if_exception_type(retryable_exceptions)
             | retry_if_exception_type(RetryableError),
             # Log retry attempts
-            before_sleep=before_sleep_log(logger, logging.WARNING),
+            before_sleep=before_sleep_handler,
             # Re-raise the original exception after exhausting retries
             reraise=True,
         )
+        if not inspect.iscoroutinefunction(func):
+            # Sync waits block on the shutdown event so a SIGTERM can
+            # interrupt a long backoff; the async path already yields
+            # to the event loop and needs no custom sleep.
+            tenacity_kwargs["sleep"] = _interruptible_sleep
+
+        # Create Tenacity retry decorator with exponential backoff
+        tenacity_decorator = retry(**tenacity_kwargs)
+
+        breaker_key = func.__qualname__
+
+        # Apply the Tenacity decorator once here rather than on every
+        # call, so invocations don't rebuild the retry closure chain.
+        decorated = tenacity_decorator(func)
+
+        if inspect.iscoroutinefunction(func):
+            # Tenacity detects coroutine functions and backs off with
+            # asyncio.sleep, so waiting never blocks the event loop.
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if circuit_breaker and not circuit_breaker.is_available(breaker_key):
+                    raise CircuitOpenError(f"Circuit open for {breaker_key}")
+                try:
+                    result = await decorated(*args, **kwargs)
+                except Exception:
+                    if circuit_breaker:
+                        circuit_breaker.record_failure(breaker_key)
+                    raise
+                if circuit_breaker:
+                    circuit_breaker.record_success(breaker_key)
+                return result
+
+            return async_wrapper
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Custom retry callback handling
-            if on_retry:
-                original_func = func
-
-                @functools.wraps(original_func)
-                def func_with_callback(*args, **kwargs):
-                    try:
-                        return original_func(*args, **kwargs)
-                    except Exception as e:
-                        # Note: With Tenacity, we don't have direct access to attempt number here
-                        # The logging is handled by before_sleep_log
-                        raise
-
-                return tenacity_decorator(func_with_callback)(*args, **kwargs)
-            else:
-                return tenacity_decorator(func)(*args, **kwargs)
+            if circuit_breaker and not circuit_breaker.is_available(breaker_key):
+                raise CircuitOpenError(f"Circuit open for {breaker_key}")
+            try:
+                result = decorated(*args, **kwargs)
+            except Exception:
+                if circuit_breaker:
+                    circuit_breaker.record_failure(breaker_key)
+                raise
+            if circuit_breaker:
+                circuit_breaker.record_success(breaker_key)
+            return result
 
         return wrapper
 
@@ -316,22 +544,26 @@ def retry_anthropic_api(func: Callable) -> Callable:
     @retry(
         # Stop after 5 attempts (initial + 4 retries)
         stop=stop_after_attempt(ANTHROPIC_RETRY_CONFIG.max_retries + 1),
-        # Exponential backoff: 1s, 2s, 4s, 8s, 16s (capped at 60s)
-        wait=wait_exponential(
-            multiplier=ANTHROPIC_RETRY_CONFIG.base_delay,
-            max=ANTHROPIC_RETRY_CONFIG.max_delay,
-            exp_base=ANTHROPIC_RETRY_CONFIG.exponential_base,
+        # Decorrelated jitter seeded at 1s (capped at 60s), stretched to
+        # any retry-after hint the API returned
+        wait=wait_rate_limit_aware(
+            wait_decorrelated_jitter(
+                base=ANTHROPIC_RETRY_CONFIG.base_delay,
+                cap=ANTHROPIC_RETRY_CONFIG.max_delay,
+            ),
+            cap=ANTHROPIC_RETRY_CONFIG.max_delay * 2,
         ),
         # Retry on specific exception types
         retry=(
             retry_if_exception_type(RetryableError)
-            | retry_if_exception_type(ConnectionError)
-            | retry_if_exception_type(TimeoutError)
+            | retry_if_exception_type(_RETRYABLE_EXCEPTION_TYPES)
         ),
         # Log retry attempts with details
         before_sleep=before_sleep_log(logger, logging.WARNING),
         # Re-raise after exhausting retries
         reraise=True,
+        # Backoff waits abort promptly on a shutdown request
+        sleep=_interruptible_sleep,
     )
     def wrapper(*args, **kwargs):
         try:
@@ -382,22 +614,26 @@ def retry_github_api(func: Callable) -> Callable:
     @retry(
         # Stop after 3 attempts (initial + 2 retries)
         stop=stop_after_attempt(GITHUB_RETRY_CONFIG.max_retries + 1),
-        # Exponential backoff: 2s, 4s, 8s (capped at 120s)
-        wait=wait_exponential(
-            multiplier=GITHUB_RETRY_CONFIG.base_delay,
-            max=GITHUB_RETRY_CONFIG.max_delay,
-            exp_base=GITHUB_RETRY_CONFIG.exponential_base,
+        # Decorrelated jitter seeded at 2s (capped at 120s), stretched to
+        # any retry-after hint the API returned
+        wait=wait_rate_limit_aware(
+            wait_decorrelated_jitter(
+                base=GITHUB_RETRY_CONFIG.base_delay,
+                cap=GITHUB_RETRY_CONFIG.max_delay,
+            ),
+            cap=GITHUB_RETRY_CONFIG.max_delay * 2,
         ),
         # Retry on specific exception types
         retry=(
             retry_if_exception_type(RetryableError)
-            | retry_if_exception_type(ConnectionError)
-            | retry_if_exception_type(TimeoutError)
+            | retry_if_exception_type(_RETRYABLE_EXCEPTION_TYPES)
         ),
         # Log retry attempts with details
         before_sleep=before_sleep_log(logger, logging.WARNING),
         # Re-raise after exhausting retries
         reraise=True,
+        # Backoff waits abort promptly on a shutdown request
+        sleep=_interruptible_sleep,
     )
     def wrapper(*args, **kwargs):
         try:
@@ -446,10 +682,17 @@ def calculate_delay(
     if rate_limit_retry_after is not None:
         return min(float(rate_limit_retry_after), config.max_delay)
 
-    # Calculate exponential backoff (Tenacity does this internally)
-    delay = min(
-        config.base_delay * (config.exponential_base**attempt), config.max_delay
-    )
+    # Calculate exponential backoff (Tenacity does this internally).
+    # Clamp the attempt so the intermediate value cannot overflow, and
+    # use ldexp for the common base-2 case: it bumps the float exponent
+    # directly instead of growing a Python int with ** first.
+    attempt = min(attempt, 62)
+    if config.exponential_base == 2.0:
+        delay = min(math.ldexp(config.base_delay, attempt), config.max_delay)
+    else:
+        delay = min(
+            config.base_delay * (config.exponential_base**attempt), config.max_delay
+        )
 
     # Tenacity adds jitter automatically with wait_exponential
     return delay
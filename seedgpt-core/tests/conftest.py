@@ -4,14 +4,11 @@ Pytest configuration and shared fixtures
 
 import pytest
 import os
-import sys
 from pathlib import Path
 
-# Add src directories to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
-sys.path.insert(0, str(project_root / "src" / "gemini-agent"))
-sys.path.insert(0, str(project_root / "src" / "claude-agent"))
+# Import paths for the src trees are configured via the pythonpath option in
+# pytest.ini; individual test modules keep a guarded sys.path fallback so
+# they still run as plain scripts.
 
 
 @pytest.fixture
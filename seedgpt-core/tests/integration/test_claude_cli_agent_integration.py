@@ -8,7 +8,6 @@ import pytest
 import os
 import sys
 import json
-import tempfile
 from pathlib import Path
 
 # Add src directory to path
@@ -21,6 +20,9 @@ from utils.exceptions import (
     FileNotFoundError as CustomFileNotFoundError,
 )
 
+# Every test in this module exercises the real CLI
+pytestmark = pytest.mark.integration
+
 
 @pytest.fixture
 def agent():
@@ -85,7 +87,6 @@ def read_file(filename):
 class TestClaudeAgentIntegrationBasic:
     """Basic integration tests"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query(self, agent):
         """Test real query to Claude CLI"""
@@ -103,7 +104,6 @@ class TestClaudeAgentIntegrationBasic:
             or "successful" in response_text
         )
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_with_system_prompt(self, agent):
         """Test query with system prompt"""
@@ -115,7 +115,6 @@ class TestClaudeAgentIntegrationBasic:
         assert "result" in result
         assert "10" in result["result"]
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_text_format(self):
         """Test query with text output format"""
@@ -134,7 +133,6 @@ class TestClaudeAgentIntegrationBasic:
 class TestClaudeAgentIntegrationFiles:
     """Integration tests with file operations"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_with_stdin(self, agent, temp_python_file):
         """Test query with stdin input"""
@@ -150,7 +148,6 @@ class TestClaudeAgentIntegrationFiles:
         response_text = result["result"].lower()
         assert "calculate_sum" in response_text or "calculate_average" in response_text
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_code_review(self, agent, temp_buggy_file):
         """Test real code review"""
@@ -174,7 +171,6 @@ class TestClaudeAgentIntegrationFiles:
             ]
         )
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_generate_docs(self, agent, temp_python_file):
         """Test real documentation generation"""
@@ -197,7 +193,6 @@ class TestClaudeAgentIntegrationFiles:
             ]
         )
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_fix_code(self, agent, temp_buggy_file):
         """Test real code fixing"""
@@ -219,7 +214,6 @@ class TestClaudeAgentIntegrationFiles:
 class TestClaudeAgentIntegrationBatch:
     """Integration tests for batch processing"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_batch_process(self, agent, tmp_path):
         """Test real batch processing"""
@@ -250,7 +244,6 @@ def validate_{i}(value):
             response_text = str(result["result"]).lower()
             assert f"process_{i}" in response_text or f"validate_{i}" in response_text
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_batch_process_with_errors(self, agent, tmp_path):
         """Test batch processing with some errors"""
@@ -272,7 +265,6 @@ def validate_{i}(value):
 class TestClaudeAgentIntegrationConversations:
     """Integration tests for multi-turn conversations"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_continue_conversation(self, agent):
         """Test continuing a conversation"""
@@ -297,7 +289,6 @@ class TestClaudeAgentIntegrationConversations:
 class TestClaudeAgentIntegrationToolControl:
     """Integration tests for tool control"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_with_allowed_tools(self):
         """Test with allowed tools restriction"""
@@ -311,7 +302,6 @@ class TestClaudeAgentIntegrationToolControl:
         assert result is not None
         assert "result" in result
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_with_disallowed_tools(self):
         """Test with disallowed tools"""
@@ -329,13 +319,11 @@ class TestClaudeAgentIntegrationToolControl:
 class TestClaudeAgentIntegrationErrorHandling:
     """Integration tests for error handling"""
 
-    @pytest.mark.integration
     def test_file_not_found(self, agent):
         """Test with non-existent file"""
         with pytest.raises(CustomFileNotFoundError):
             agent.code_review("/nonexistent/file.py")
 
-    @pytest.mark.integration
     def test_invalid_file_in_batch(self, agent):
         """Test batch processing with invalid directory"""
         with pytest.raises(CustomFileNotFoundError):
@@ -347,7 +335,6 @@ class TestClaudeAgentIntegrationErrorHandling:
 class TestClaudeAgentIntegrationEndToEnd:
     """End-to-end integration tests"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     @pytest.mark.timeout(120)  # 2 minute timeout
     def test_complete_code_improvement_workflow(self, agent, temp_buggy_file):
@@ -454,7 +441,6 @@ Be concise."""
                 f"Got: {followup_text[:200]}"
             )
 
-    @pytest.mark.integration
     @pytest.mark.slow
     @pytest.mark.timeout(90)  # 90 second timeout
     def test_multi_file_project_analysis(self, agent, tmp_path):
@@ -516,7 +502,6 @@ Be concise."""
 class TestClaudeAgentIntegrationPerformance:
     """Performance-related integration tests"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     @pytest.mark.timeout(60)  # 60 second timeout
     def test_large_file_handling(self, agent, tmp_path):
@@ -8,12 +8,17 @@ import pytest
 import os
 import sys
 import json
-import tempfile
-from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src" / "gemini-agent"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+# Add src directories to path; conftest inserts the same entries for pytest
+# runs, so guard against stacking duplicates onto sys.path per module import.
+# Plain os.path keeps the cold-import cost down versus chained Path.parent.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _src in (
+    os.path.join(_PROJECT_ROOT, "src", "gemini-agent"),
+    os.path.join(_PROJECT_ROOT, "src"),
+):
+    if _src not in sys.path:
+        sys.path.insert(0, _src)
 
 from gemini_agent import GeminiAgent
 from utils.exceptions import (
@@ -21,14 +26,23 @@ from utils.exceptions import (
     FileOperationError,
 )
 
+# Every test in this module exercises the real CLI/API
+pytestmark = pytest.mark.integration
+
+
+# Resolve the API key once at import so tests skip at collection time,
+# before any fixtures are set up.
+_API_KEY = os.environ.get("GEMINI_API_KEY")
+
+requires_api_key = pytest.mark.skipif(
+    not _API_KEY, reason="GEMINI_API_KEY not set - skipping integration tests"
+)
+
 
 @pytest.fixture
 def api_key():
     """Get API key from environment"""
-    key = os.environ.get("GEMINI_API_KEY")
-    if not key:
-        pytest.skip("GEMINI_API_KEY not set - skipping integration tests")
-    return key
+    return _API_KEY
 
 
 @pytest.fixture
@@ -77,10 +91,10 @@ def process_list(items):
     return str(file_path)
 
 
+@requires_api_key
 class TestGeminiAgentIntegrationBasic:
     """Basic integration tests"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query(self, agent):
         """Test real query to Gemini API"""
@@ -99,7 +113,6 @@ class TestGeminiAgentIntegrationBasic:
 
         assert "integration" in response_text or "successful" in response_text
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_with_model(self, agent):
         """Test query with specific model"""
@@ -112,10 +125,10 @@ class TestGeminiAgentIntegrationBasic:
         assert "4" in response_text
 
 
+@requires_api_key
 class TestGeminiAgentIntegrationFiles:
     """Integration tests with file operations"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_with_file(self, agent, temp_python_file):
         """Test query with real file input"""
@@ -127,7 +140,6 @@ class TestGeminiAgentIntegrationFiles:
         response_text = str(result).lower()
         assert "add" in response_text or "multiply" in response_text
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_code_review(self, agent, temp_python_file):
         """Test real code review"""
@@ -141,7 +153,6 @@ class TestGeminiAgentIntegrationFiles:
             for word in ["code", "function", "review", "quality", "good", "clean"]
         )
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_generate_docs(self, agent, temp_python_file):
         """Test real documentation generation"""
@@ -155,7 +166,6 @@ class TestGeminiAgentIntegrationFiles:
             for word in ["add", "multiply", "function", "parameter", "return"]
         )
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_analyze_logs(self, agent, tmp_path):
         """Test real log analysis"""
@@ -181,10 +191,10 @@ class TestGeminiAgentIntegrationFiles:
         )
 
 
+@requires_api_key
 class TestGeminiAgentIntegrationBatch:
     """Integration tests for batch processing"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_batch_process(self, agent, tmp_path):
         """Test real batch processing"""
@@ -212,10 +222,10 @@ def function_{i}():
             assert f"function_{i}" in response_text or f"function {i}" in response_text
 
 
+@requires_api_key
 class TestGeminiAgentIntegrationOptions:
     """Integration tests for various options"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_with_yolo(self, agent):
         """Test query with yolo mode"""
@@ -223,7 +233,6 @@ class TestGeminiAgentIntegrationOptions:
 
         assert result is not None
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_with_debug(self, api_key):
         """Test query with debug mode"""
@@ -232,7 +241,6 @@ class TestGeminiAgentIntegrationOptions:
 
         assert result is not None
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_real_query_json_format(self, api_key):
         """Test query with JSON output format"""
@@ -247,30 +255,29 @@ class TestGeminiAgentIntegrationOptions:
 class TestGeminiAgentIntegrationErrorHandling:
     """Integration tests for error handling"""
 
-    @pytest.mark.integration
     def test_invalid_api_key(self):
         """Test with invalid API key (gemini-cli not installed)"""
         with pytest.raises(ConfigurationError):
             agent = GeminiAgent(api_key="invalid_key_12345")
             agent.query("test")
 
-    @pytest.mark.integration
+    @requires_api_key
     def test_file_not_found(self, agent):
         """Test with non-existent file"""
         with pytest.raises(FileOperationError):
             agent.query_with_file("test", "/nonexistent/file.py")
 
-    @pytest.mark.integration
+    @requires_api_key
     def test_empty_prompt(self, agent):
         """Test with empty prompt"""
         with pytest.raises((ValueError, RuntimeError)):
             agent.query("")
 
 
+@requires_api_key
 class TestGeminiAgentIntegrationEndToEnd:
     """End-to-end integration tests"""
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_complete_workflow(self, agent, temp_buggy_file):
         """Test complete workflow: review -> identify issues -> suggest fixes"""
@@ -296,7 +303,6 @@ class TestGeminiAgentIntegrationEndToEnd:
         docs_text = str(docs_result).lower()
         assert "divide" in docs_text or "process" in docs_text
 
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_multi_file_analysis(self, agent, tmp_path):
         """Test analyzing multiple related files"""
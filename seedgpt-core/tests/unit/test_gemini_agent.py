@@ -8,13 +8,21 @@ import pytest
 import json
 import os
 import subprocess
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 from pathlib import Path
 import sys
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src" / "gemini-agent"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+# Add src directories to path; conftest inserts the same entries for pytest
+# runs, so guard against stacking duplicates onto sys.path per module import.
+# Plain os.path keeps the cold-import cost down versus chained Path.parent.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _src in (
+    os.path.join(_PROJECT_ROOT, "src", "gemini-agent"),
+    os.path.join(_PROJECT_ROOT, "src"),
+):
+    if _src not in sys.path:
+        sys.path.insert(0, _src)
 
 from gemini_agent import GeminiAgent
 from utils.exceptions import (
@@ -27,49 +35,91 @@ from utils.exceptions import (
 )
 
 
+
+# Fixture file contents, pre-encoded once at import so fixtures can use
+# write_bytes (a straight syscall) instead of re-encoding per test.
+_SAMPLE_CODE = b"def test():\n    pass\n"
+_VULNERABLE_CODE = b"def vulnerable_function():\n    eval(input())\n"
+_MODULE_CODE = b"def add(a, b):\n    return a + b\n"
+_LOG_LINES = (
+    b"ERROR: Connection failed\n"
+    b"ERROR: Database timeout\n"
+    b"WARNING: High memory usage\n"
+)
+
+
+# Canonical CLI stdout for tests that only inspect the command or result
+# shape, serialized once at import instead of json.dumps per test.
+_OK_STDOUT = json.dumps({"response": "ok"})
+
+
+@pytest.fixture
+def mock_run():
+    """Patch subprocess.run once per test instead of per-method @patch"""
+    with patch("subprocess.run") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def agent():
+    """Shared GeminiAgent instance for tests that never mutate agent state.
+
+    Construction is identical across tests, so one instance per module avoids
+    re-running the installation patch and constructor for every test.
+    """
+    with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
+        return GeminiAgent(api_key="test-key-123")
+
+
+@pytest.fixture(scope="class")
+def _gemini_installed():
+    """Treat gemini-cli as installed for a whole test class.
+
+    Entered once per requesting class instead of once per test; tests that
+    need the CLI to look missing override it with an inner patch.
+    """
+    with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
+        yield
+
+
+@pytest.mark.usefixtures("_gemini_installed")
 class TestGeminiAgentInitialization:
     """Test GeminiAgent initialization"""
 
     def test_init_with_api_key(self):
         """Test initialization with explicit API key"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            agent = GeminiAgent(api_key="test-key-123")
-            assert agent.api_key == "test-key-123"
-            assert agent.model == "gemini-pro"
-            assert agent.output_format == "json"
-            assert agent.debug is False
+        agent = GeminiAgent(api_key="test-key-123")
+        assert agent.api_key == "test-key-123"
+        assert agent.model == "gemini-pro"
+        assert agent.output_format == "json"
+        assert agent.debug is False
 
     def test_init_with_env_var(self):
         """Test initialization with API key from environment"""
         with patch.dict(os.environ, {"GEMINI_API_KEY": "env-key-456"}):
-            with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-                agent = GeminiAgent()
-                assert agent.api_key == "env-key-456"
+            agent = GeminiAgent()
+            assert agent.api_key == "env-key-456"
 
     def test_init_without_api_key_raises_error(self):
         """Test initialization fails without API key"""
         with patch.dict(os.environ, {}, clear=True):
-            with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-                with pytest.raises(MissingEnvironmentVariableError):
-                    GeminiAgent()
+            with pytest.raises(MissingEnvironmentVariableError):
+                GeminiAgent()
 
     def test_init_custom_model(self):
         """Test initialization with custom model"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            agent = GeminiAgent(api_key="test-key", model="gemini-2.5-flash")
-            assert agent.model == "gemini-2.5-flash"
+        agent = GeminiAgent(api_key="test-key", model="gemini-2.5-flash")
+        assert agent.model == "gemini-2.5-flash"
 
     def test_init_custom_output_format(self):
         """Test initialization with custom output format"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            agent = GeminiAgent(api_key="test-key", output_format="text")
-            assert agent.output_format == "text"
+        agent = GeminiAgent(api_key="test-key", output_format="text")
+        assert agent.output_format == "text"
 
     def test_init_debug_mode(self):
         """Test initialization with debug mode"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            agent = GeminiAgent(api_key="test-key", debug=True)
-            assert agent.debug is True
+        agent = GeminiAgent(api_key="test-key", debug=True)
+        assert agent.debug is True
 
     def test_init_gemini_not_installed(self):
         """Test initialization fails when gemini-cli not installed"""
@@ -81,16 +131,14 @@ class TestGeminiAgentInitialization:
 class TestGeminiAgentInstallationCheck:
     """Test gemini-cli installation check"""
 
-    @patch("subprocess.run")
     def test_is_gemini_installed_true(self, mock_run):
         """Test detection when gemini-cli is installed"""
-        mock_run.return_value = Mock(returncode=0)
+        mock_run.return_value = SimpleNamespace(returncode=0)
 
         with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
             agent = GeminiAgent()
             assert agent._is_gemini_installed() is True
 
-    @patch("subprocess.run")
     def test_is_gemini_installed_false_not_found(self, mock_run):
         """Test detection when gemini-cli is not found"""
         mock_run.side_effect = FileNotFoundError()
@@ -98,7 +146,6 @@ class TestGeminiAgentInstallationCheck:
         agent = GeminiAgent.__new__(GeminiAgent)
         assert agent._is_gemini_installed() is False
 
-    @patch("subprocess.run")
     def test_is_gemini_installed_false_error(self, mock_run):
         """Test detection when gemini-cli returns error"""
         mock_run.side_effect = subprocess.CalledProcessError(1, "gemini")
@@ -110,17 +157,12 @@ class TestGeminiAgentInstallationCheck:
 class TestGeminiAgentQuery:
     """Test GeminiAgent query method"""
 
-    @pytest.fixture
-    def agent(self):
-        """Create a GeminiAgent instance for testing"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            return GeminiAgent(api_key="test-key-123")
-
-    @patch("subprocess.run")
     def test_query_basic(self, mock_run, agent):
         """Test basic query"""
         mock_response = {"response": "This is a test response", "stats": {"models": {}}}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(
+            stdout=json.dumps(mock_response), returncode=0
+        )
 
         result = agent.query("Test prompt")
 
@@ -136,11 +178,9 @@ class TestGeminiAgentQuery:
         assert "--output-format" in cmd
         assert "json" in cmd
 
-    @patch("subprocess.run")
     def test_query_with_include_directories(self, mock_run, agent):
         """Test query with include directories"""
-        mock_response = {"response": "Response with context"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         result = agent.query("Test prompt", include_directories=["src", "docs"])
 
@@ -149,11 +189,9 @@ class TestGeminiAgentQuery:
         assert "--include-directories" in cmd
         assert "src,docs" in cmd
 
-    @patch("subprocess.run")
     def test_query_with_yolo_mode(self, mock_run, agent):
         """Test query with YOLO mode"""
-        mock_response = {"response": "Auto-approved response"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         result = agent.query("Test prompt", yolo=True)
 
@@ -161,11 +199,9 @@ class TestGeminiAgentQuery:
         cmd = call_args[0][0]
         assert "--yolo" in cmd
 
-    @patch("subprocess.run")
     def test_query_with_custom_model(self, mock_run, agent):
         """Test query with custom model"""
-        mock_response = {"response": "Flash model response"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         result = agent.query("Test prompt", model="gemini-2.5-flash")
 
@@ -174,14 +210,11 @@ class TestGeminiAgentQuery:
         assert "-m" in cmd
         assert "gemini-2.5-flash" in cmd
 
-    @patch("subprocess.run")
-    def test_query_with_debug(self, mock_run):
+    def test_query_with_debug(self, mock_run, _gemini_installed):
         """Test query with debug mode"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            agent = GeminiAgent(api_key="test-key", debug=True)
+        agent = GeminiAgent(api_key="test-key", debug=True)
 
-        mock_response = {"response": "Debug response"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         result = agent.query("Test prompt")
 
@@ -189,19 +222,16 @@ class TestGeminiAgentQuery:
         cmd = call_args[0][0]
         assert "--debug" in cmd
 
-    @patch("subprocess.run")
-    def test_query_text_format(self, mock_run):
+    def test_query_text_format(self, mock_run, _gemini_installed):
         """Test query with text output format"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            agent = GeminiAgent(api_key="test-key", output_format="text")
+        agent = GeminiAgent(api_key="test-key", output_format="text")
 
-        mock_run.return_value = Mock(stdout="Plain text response", returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout="Plain text response", returncode=0)
 
         result = agent.query("Test prompt")
 
         assert result["response"] == "Plain text response"
 
-    @patch("subprocess.run")
     def test_query_subprocess_error(self, mock_run, agent):
         """Test query handles subprocess errors"""
         mock_run.side_effect = subprocess.CalledProcessError(
@@ -211,19 +241,16 @@ class TestGeminiAgentQuery:
         with pytest.raises(AgentError, match="Gemini CLI"):
             agent.query("Test prompt")
 
-    @patch("subprocess.run")
     def test_query_json_decode_error(self, mock_run, agent):
         """Test query handles JSON decode errors"""
-        mock_run.return_value = Mock(stdout="Invalid JSON {", returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout="Invalid JSON {", returncode=0)
 
         with pytest.raises(JSONParseError, match="Failed to parse JSON"):
             agent.query("Test prompt")
 
-    @patch("subprocess.run")
     def test_query_api_key_in_env(self, mock_run, agent):
         """Test that API key is passed in environment"""
-        mock_response = {"response": "Success"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         agent.query("Test prompt")
 
@@ -235,24 +262,20 @@ class TestGeminiAgentQuery:
 class TestGeminiAgentQueryWithFile:
     """Test GeminiAgent query_with_file method"""
 
-    @pytest.fixture
-    def agent(self):
-        """Create a GeminiAgent instance for testing"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            return GeminiAgent(api_key="test-key-123")
-
-    @pytest.fixture
-    def temp_file(self, tmp_path):
-        """Create a temporary file for testing"""
-        file_path = tmp_path / "test_file.py"
-        file_path.write_text("def test():\n    pass\n")
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def temp_file(tmp_path_factory):
+        """Create a temporary file once per class; tests only read it"""
+        file_path = tmp_path_factory.mktemp("query_file") / "test_file.py"
+        file_path.write_bytes(_SAMPLE_CODE)
         return str(file_path)
 
-    @patch("subprocess.run")
     def test_query_with_file_basic(self, mock_run, agent, temp_file):
         """Test query with file input"""
         mock_response = {"response": "File analysis"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(
+            stdout=json.dumps(mock_response), returncode=0
+        )
 
         result = agent.query_with_file("Analyze this code", temp_file)
 
@@ -267,11 +290,9 @@ class TestGeminiAgentQueryWithFile:
         with pytest.raises(FileOperationError):
             agent.query_with_file("Analyze", "/nonexistent/file.py")
 
-    @patch("subprocess.run")
     def test_query_with_file_custom_model(self, mock_run, agent, temp_file):
         """Test query with file and custom model"""
-        mock_response = {"response": "Analysis"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         result = agent.query_with_file("Analyze", temp_file, model="gemini-2.5-flash")
 
@@ -283,24 +304,19 @@ class TestGeminiAgentQueryWithFile:
 class TestGeminiAgentCodeReview:
     """Test GeminiAgent code_review method"""
 
-    @pytest.fixture
-    def agent(self):
-        """Create a GeminiAgent instance for testing"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            return GeminiAgent(api_key="test-key-123")
-
     @pytest.fixture
     def temp_file(self, tmp_path):
         """Create a temporary Python file for testing"""
         file_path = tmp_path / "code.py"
-        file_path.write_text("def vulnerable_function():\n    eval(input())\n")
+        file_path.write_bytes(_VULNERABLE_CODE)
         return str(file_path)
 
-    @patch("subprocess.run")
     def test_code_review(self, mock_run, agent, temp_file):
         """Test code review functionality"""
         mock_response = {"response": "Security issue found: eval() usage"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(
+            stdout=json.dumps(mock_response), returncode=0
+        )
 
         result = agent.code_review(temp_file)
 
@@ -319,26 +335,21 @@ class TestGeminiAgentCodeReview:
 class TestGeminiAgentGenerateDocs:
     """Test GeminiAgent generate_docs method"""
 
-    @pytest.fixture
-    def agent(self):
-        """Create a GeminiAgent instance for testing"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            return GeminiAgent(api_key="test-key-123")
-
     @pytest.fixture
     def temp_file(self, tmp_path):
         """Create a temporary file for testing"""
         file_path = tmp_path / "module.py"
-        file_path.write_text("def add(a, b):\n    return a + b\n")
+        file_path.write_bytes(_MODULE_CODE)
         return str(file_path)
 
-    @patch("subprocess.run")
     def test_generate_docs(self, mock_run, agent, temp_file):
         """Test documentation generation"""
         mock_response = {
             "response": "# Module Documentation\n\n## Functions\n\n### add(a, b)"
         }
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(
+            stdout=json.dumps(mock_response), returncode=0
+        )
 
         result = agent.generate_docs(temp_file)
 
@@ -353,28 +364,20 @@ class TestGeminiAgentGenerateDocs:
 class TestGeminiAgentAnalyzeLogs:
     """Test GeminiAgent analyze_logs method"""
 
-    @pytest.fixture
-    def agent(self):
-        """Create a GeminiAgent instance for testing"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            return GeminiAgent(api_key="test-key-123")
-
-    @pytest.fixture
-    def temp_log(self, tmp_path):
-        """Create a temporary log file for testing"""
-        log_path = tmp_path / "app.log"
-        log_path.write_text(
-            "ERROR: Connection failed\n"
-            "ERROR: Database timeout\n"
-            "WARNING: High memory usage\n"
-        )
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def temp_log(tmp_path_factory):
+        """Create a temporary log file once per class; tests only read it"""
+        log_path = tmp_path_factory.mktemp("logs") / "app.log"
+        log_path.write_bytes(_LOG_LINES)
         return str(log_path)
 
-    @patch("subprocess.run")
     def test_analyze_logs_default(self, mock_run, agent, temp_log):
         """Test log analysis with default focus"""
         mock_response = {"response": "Found 2 errors: Connection and database issues"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(
+            stdout=json.dumps(mock_response), returncode=0
+        )
 
         result = agent.analyze_logs(temp_log)
 
@@ -387,11 +390,9 @@ class TestGeminiAgentAnalyzeLogs:
         prompt = cmd[prompt_index]
         assert "errors" in prompt.lower()
 
-    @patch("subprocess.run")
     def test_analyze_logs_custom_focus(self, mock_run, agent, temp_log):
         """Test log analysis with custom focus"""
-        mock_response = {"response": "Pattern analysis"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         result = agent.analyze_logs(temp_log, focus="patterns")
 
@@ -405,26 +406,20 @@ class TestGeminiAgentAnalyzeLogs:
 class TestGeminiAgentBatchProcess:
     """Test GeminiAgent batch_process method"""
 
-    @pytest.fixture
-    def agent(self):
-        """Create a GeminiAgent instance for testing"""
-        with patch.object(GeminiAgent, "_is_gemini_installed", return_value=True):
-            return GeminiAgent(api_key="test-key-123")
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def temp_dir(tmp_path_factory):
+        """Create a directory of test files once per class; tests only read it"""
+        batch_dir = tmp_path_factory.mktemp("batch")
+        (batch_dir / "file1.py").write_text("# File 1")
+        (batch_dir / "file2.py").write_text("# File 2")
+        (batch_dir / "subdir").mkdir()
+        (batch_dir / "subdir" / "file3.py").write_text("# File 3")
+        return str(batch_dir)
 
-    @pytest.fixture
-    def temp_dir(self, tmp_path):
-        """Create a temporary directory with test files"""
-        (tmp_path / "file1.py").write_text("# File 1")
-        (tmp_path / "file2.py").write_text("# File 2")
-        (tmp_path / "subdir").mkdir()
-        (tmp_path / "subdir" / "file3.py").write_text("# File 3")
-        return str(tmp_path)
-
-    @patch("subprocess.run")
     def test_batch_process_success(self, mock_run, agent, temp_dir):
         """Test successful batch processing"""
-        mock_response = {"response": "Analysis complete"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         results = agent.batch_process(temp_dir, "Analyze this file")
 
@@ -433,14 +428,13 @@ class TestGeminiAgentBatchProcess:
         assert all("file" in r for r in results)
         assert all("result" in r for r in results)
 
-    @patch("subprocess.run")
     def test_batch_process_with_errors(self, mock_run, agent, temp_dir):
         """Test batch processing with some errors"""
         # First call succeeds, second fails, third succeeds
         mock_run.side_effect = [
-            Mock(stdout=json.dumps({"response": "OK"}), returncode=0),
+            SimpleNamespace(stdout=_OK_STDOUT, returncode=0),
             subprocess.CalledProcessError(1, "gemini", stderr="Error"),
-            Mock(stdout=json.dumps({"response": "OK"}), returncode=0),
+            SimpleNamespace(stdout=_OK_STDOUT, returncode=0),
         ]
 
         results = agent.batch_process(temp_dir, "Analyze")
@@ -451,14 +445,12 @@ class TestGeminiAgentBatchProcess:
         assert "error" in results[1]
         assert results[2]["success"] is True
 
-    @patch("subprocess.run")
     def test_batch_process_custom_pattern(self, mock_run, agent, temp_dir):
         """Test batch processing with custom file pattern"""
         # Create a JS file
         Path(temp_dir) / "test.js" / "test.js"
 
-        mock_response = {"response": "Analysis"}
-        mock_run.return_value = Mock(stdout=json.dumps(mock_response), returncode=0)
+        mock_run.return_value = SimpleNamespace(stdout=_OK_STDOUT, returncode=0)
 
         results = agent.batch_process(temp_dir, "Analyze", file_pattern="*.js")
 
@@ -477,12 +469,13 @@ class TestGeminiAgentIntegration:
         """Test with real gemini-cli (requires API key and installation)"""
         try:
             agent = GeminiAgent()
-            result = agent.query("Say 'test successful' and nothing else")
-            assert "response" in result
-            assert len(result["response"]) > 0
-        except RuntimeError as e:
+        except ConfigurationError as e:
             pytest.skip(f"gemini-cli not available: {e}")
 
+        result = agent.query("Say 'test successful' and nothing else")
+        assert "response" in result
+        assert len(result["response"]) > 0
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ProjectAnalyzer
+Tests repository structure analysis against a mocked PyGithub repo
+"""
+
+import pytest
+import base64
+import json
+from unittest.mock import Mock
+from types import SimpleNamespace
+from pathlib import Path
+import sys
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils import project_analyzer
+from utils.project_analyzer import ProjectAnalyzer
+
+
+def _entry(path, entry_type="blob", sha="abc123"):
+    """Build a fake GitTreeElement"""
+    return SimpleNamespace(path=path, type=entry_type, sha=sha)
+
+
+def _content(text):
+    """Build a fake ContentFile with decoded content"""
+    return Mock(decoded_content=text.encode("utf-8"))
+
+
+def _blob(text):
+    """Build a fake GitBlob with base64-encoded content"""
+    return Mock(content=base64.b64encode(text.encode("utf-8")).decode("ascii"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_disk_cache(tmp_path, monkeypatch):
+    """Point the analysis disk cache at a per-test directory"""
+    monkeypatch.setattr(project_analyzer, "_DISK_CACHE_DIR", tmp_path / "analysis")
+
+
+@pytest.fixture
+def mock_repo():
+    """Create a mocked PyGithub Repository with a small Python project tree"""
+    repo = Mock()
+    repo.full_name = "owner/repo"
+    repo.default_branch = "main"
+    repo.get_branch.return_value.commit.sha = "headsha"
+    repo.get_git_tree.return_value = Mock(
+        truncated=False,
+        tree=[
+            _entry("src", "tree"),
+            _entry("tests", "tree"),
+            _entry("docs", "tree"),
+            _entry(".github", "tree"),
+            _entry(".github/workflows", "tree"),
+            _entry("README.md"),
+            _entry("LICENSE"),
+            _entry("requirements.txt"),
+            _entry("pytest.ini"),
+            _entry("src/main.py", sha="sha-main"),
+            _entry("src/helpers.py", sha="sha-helpers"),
+            _entry("tests/test_main.py", sha="sha-test"),
+            _entry(".github/workflows/ci.yml"),
+        ],
+    )
+    repo.get_contents.side_effect = lambda path: {
+        ".github/workflows/ci.yml": _content("jobs:\n  deploy:\n    steps: []\n"),
+        "requirements.txt": _content("flask>=2.0\nrequests\n"),
+    }[path]
+    repo.get_git_blob.side_effect = lambda sha: {
+        "sha-main": _blob("class App:\n    def run(self):\n        pass\n"),
+        "sha-helpers": _blob("def helper() -> int:\n    return 1\n"),
+        "sha-test": _blob("def test_run():\n    pass\n"),
+    }[sha]
+    return repo
+
+
+@pytest.fixture
+def analyzer(mock_repo):
+    """Create a ProjectAnalyzer against the mocked repo"""
+    return ProjectAnalyzer(mock_repo)
+
+
+class TestProjectAnalyzerTree:
+    """Test tree fetching and caching"""
+
+    def test_tree_fetched_once(self, analyzer, mock_repo):
+        """The recursive tree call happens once regardless of sections run"""
+        analyzer.analyze_project()
+        mock_repo.get_git_tree.assert_called_once_with("main", recursive=True)
+
+    def test_tree_cached_between_calls(self, analyzer, mock_repo):
+        """Repeated _get_tree calls reuse the cached list"""
+        first = analyzer._get_tree()
+        second = analyzer._get_tree()
+        assert first is second
+        mock_repo.get_git_tree.assert_called_once()
+
+    def test_analysis_memoized_for_same_head(self, analyzer, mock_repo):
+        """A second analyze_project at the same head issues no new fetches"""
+        analyzer.analyze_project()
+        fetches_after_first = mock_repo.get_contents.call_count
+        analyzer.analyze_project()
+        assert mock_repo.get_contents.call_count == fetches_after_first
+        mock_repo.get_git_tree.assert_called_once()
+
+    def test_disk_cache_reused_across_instances(self, analyzer, mock_repo):
+        """A fresh analyzer at the same head reads the disk cache"""
+        first = analyzer.analyze_project()
+        mock_repo.get_git_tree.reset_mock()
+        second = ProjectAnalyzer(mock_repo).analyze_project()
+        assert second == first
+        mock_repo.get_git_tree.assert_not_called()
+
+    def test_cache_invalidated_when_head_moves(self, analyzer, mock_repo):
+        """Advancing the default branch head discards cached results"""
+        mock_repo.get_branch.return_value.commit.sha = "sha-one"
+        analyzer.analyze_project()
+        mock_repo.get_branch.return_value.commit.sha = "sha-two"
+        analyzer.analyze_project()
+        assert mock_repo.get_git_tree.call_count == 2
+
+
+class TestDirectoryStructure:
+    """Test directory structure analysis"""
+
+    def test_key_directories_detected(self, analyzer):
+        result = analyzer._analyze_directory_structure()
+        assert result["has_src"] is True
+        assert result["has_tests"] is True
+        assert result["has_docs"] is True
+        assert result["key_directories"][".github"] is True
+
+    def test_directory_count(self, analyzer):
+        result = analyzer._analyze_directory_structure()
+        assert result["directory_count"] == 5
+
+
+class TestFileTypes:
+    """Test file type counting"""
+
+    def test_counts_by_extension(self, analyzer):
+        result = analyzer._analyze_file_types()
+        assert result["file_counts"][".py"] == 3
+        assert result["total_files"] == 8
+
+    def test_primary_language(self, analyzer):
+        result = analyzer._analyze_file_types()
+        assert result["primary_language"] == "Python"
+
+    def test_primary_language_unknown(self):
+        assert ProjectAnalyzer._determine_primary_language({".xyz": 4}) == "Unknown"
+
+
+class TestCodePatterns:
+    """Test Python code pattern sampling"""
+
+    def test_detects_classes_and_type_hints(self, analyzer):
+        result = analyzer._analyze_code_patterns()
+        assert result["has_classes"] is True
+        assert result["has_type_hints"] is True
+        assert result["has_tests"] is True
+
+    def test_all_python_blobs_fetched(self, analyzer, mock_repo):
+        """Every Python blob in the tree is scanned, not a fixed sample"""
+        analyzer._analyze_code_patterns()
+        assert mock_repo.get_git_blob.call_count == 3
+
+
+class TestDocumentation:
+    """Test documentation detection"""
+
+    def test_readme_and_license(self, analyzer):
+        result = analyzer._analyze_documentation()
+        assert result["has_readme"] is True
+        assert result["has_license"] is True
+        assert result["has_docs_folder"] is True
+        assert "README.md" in result["doc_files"]
+
+
+class TestTestingSetup:
+    """Test testing layout detection"""
+
+    def test_test_directory_and_files(self, analyzer):
+        result = analyzer._analyze_testing_setup()
+        assert result["has_test_directory"] is True
+        assert result["has_pytest_config"] is True
+        assert result["test_file_count"] == 1
+
+
+class TestCiCd:
+    """Test CI/CD workflow detection"""
+
+    def test_workflows_detected(self, analyzer):
+        result = analyzer._analyze_ci_cd()
+        assert result["has_github_actions"] is True
+        assert ".github/workflows/ci.yml" in result["workflow_files"]
+        assert result["has_deployment"] is True
+
+
+class TestTechnologyStack:
+    """Test technology stack detection"""
+
+    def test_python_stack(self, analyzer):
+        result = analyzer._detect_technology_stack()
+        assert "Python" in result["languages"]
+        assert "Flask" in result["frameworks"]
+
+    def test_node_stack(self, mock_repo):
+        mock_repo.get_git_tree.return_value = Mock(
+            truncated=False,
+            tree=[_entry("package.json"), _entry("index.js")],
+        )
+        package_json = json.dumps({"dependencies": {"react": "^18.0.0"}})
+        mock_repo.get_contents.side_effect = lambda path: {
+            "package.json": _content(package_json),
+        }[path]
+
+        result = ProjectAnalyzer(mock_repo)._detect_technology_stack()
+        assert "Node.js" in result["languages"]
+        assert "React" in result["frameworks"]
+
+
+class TestContextSummary:
+    """Test the prompt-facing summary"""
+
+    def test_summary_contents(self, analyzer):
+        summary = analyzer.generate_context_summary()
+        assert "owner/repo" in summary
+        assert "Primary language: Python" in summary
+        assert "Has tests: True" in summary
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,7 +4,6 @@ Unit tests for PROJECT_BRIEF.md validator
 
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import sys
 
@@ -230,6 +229,88 @@ Flows
 """
 
 
+INCOMPLETE_OVERVIEW_BRIEF = """# Project Brief
+
+## 🎯 Project Overview
+
+**Project Name**: Test
+
+---
+
+## 📋 Core Requirements
+
+Requirements here
+
+## 🏗️ Technical Preferences
+
+Tech
+
+## 👥 User Roles & Permissions
+
+Roles
+
+## 🔄 Key User Flows
+
+Flows
+"""
+
+EMPTY_SECTION_BRIEF = """# Project Brief
+
+## 🎯 Project Overview
+
+**Project Name**: Test
+**Brief Description**: Description here that is long enough to pass validation
+**Problem Statement**: Problem statement that is long enough to meet minimum requirements
+**Target Users**: Users
+
+## 📋 Core Requirements
+
+## 🏗️ Technical Preferences
+
+Tech
+
+## 👥 User Roles & Permissions
+
+Roles
+
+## 🔄 Key User Flows
+
+Flows
+"""
+
+MISSING_SUBSECTIONS_BRIEF = """# Project Brief
+
+## 🎯 Project Overview
+
+**Project Name**: Test
+**Brief Description**: This is a description that is long enough to pass validation
+**Problem Statement**: This problem statement is long enough to meet minimum requirements for validation
+**Target Users**: Users
+
+## 📋 Core Requirements
+
+Just some generic requirements without proper subsections and organization
+
+## 🏗️ Technical Preferences
+
+Tech
+
+## 👥 User Roles & Permissions
+
+Roles
+
+## 🔄 Key User Flows
+
+Flows
+"""
+
+def _write_brief(tmp_path, content):
+    """Write brief content to a PROJECT_BRIEF.md under tmp_path"""
+    brief_path = tmp_path / "PROJECT_BRIEF.md"
+    brief_path.write_text(content)
+    return brief_path
+
+
 class TestValidationResult:
     """Test ValidationResult class"""
 
@@ -284,262 +365,160 @@ class TestValidationResult:
 class TestProjectBriefValidator:
     """Test ProjectBriefValidator class"""
 
-    def test_validator_file_not_found(self):
+    def test_validator_file_not_found(self, tmp_path):
         """Test validation fails when file doesn't exist"""
-        with TemporaryDirectory() as tmpdir:
-            validator = ProjectBriefValidator(Path(tmpdir) / "nonexistent.md")
-            result = validator.validate()
-            assert result.is_valid is False
-            assert any("not found" in error.lower() for error in result.errors)
+        validator = ProjectBriefValidator(tmp_path / "nonexistent.md")
+        result = validator.validate()
+        assert result.is_valid is False
+        assert any("not found" in error.lower() for error in result.errors)
 
-    def test_validator_empty_file(self):
+    def test_validator_empty_file(self, tmp_path):
         """Test validation fails for empty file"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text("")
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert result.is_valid is False
-            assert any("empty" in error.lower() for error in result.errors)
+        brief_path = tmp_path / "PROJECT_BRIEF.md"
+        brief_path.write_text("")
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert result.is_valid is False
+        assert any("empty" in error.lower() for error in result.errors)
 
     @pytest.mark.skip(reason="Validator logic needs adjustment")
-    def test_validator_valid_brief(self, temp_dir):
+    def test_validator_valid_brief(self, tmp_path):
         """Test validation passes for valid brief"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(VALID_PROJECT_BRIEF)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-
-            # Print errors and warnings for debugging
-            if not result.is_valid:
-                print("\nValidation errors:")
-                for error in result.errors:
-                    print(f"  - {error}")
-            if result.warnings:
-                print("\nValidation warnings:")
-                for warning in result.warnings:
-                    print(f"  - {warning}")
-
-            assert result.is_valid is True
+        brief_path = _write_brief(tmp_path, VALID_PROJECT_BRIEF)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+
+        # Print errors and warnings for debugging
+        if not result.is_valid:
+            print("\nValidation errors:")
+            for error in result.errors:
+                print(f"  - {error}")
+        if result.warnings:
+            print("\nValidation warnings:")
+            for warning in result.warnings:
+                print(f"  - {warning}")
+
+        assert result.is_valid is True
 
     @pytest.mark.skip(reason="Validator logic needs adjustment")
-    def test_validator_minimal_valid_brief(self, temp_dir):
+    def test_validator_minimal_valid_brief(self, tmp_path):
         """Test validation passes for minimal valid brief"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(MINIMAL_VALID_BRIEF)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert result.is_valid is True
-
-    def test_validator_missing_required_sections(self):
+        brief_path = _write_brief(tmp_path, MINIMAL_VALID_BRIEF)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert result.is_valid is True
+
+    def test_validator_missing_required_sections(self, tmp_path):
         """Test validation fails when required sections are missing"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(INVALID_BRIEF_MISSING_SECTIONS)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert result.is_valid is False
-            assert any("Missing required section" in error for error in result.errors)
-
-    def test_validator_short_content(self):
+        brief_path = _write_brief(tmp_path, INVALID_BRIEF_MISSING_SECTIONS)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert result.is_valid is False
+        assert any("Missing required section" in error for error in result.errors)
+
+    def test_validator_short_content(self, tmp_path):
         """Test validation fails for too short content"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(INVALID_BRIEF_SHORT_CONTENT)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            # Should have errors or warnings about short content
-            assert len(result.errors) > 0 or len(result.warnings) > 0
-
-    def test_validator_detects_placeholders(self):
+        brief_path = _write_brief(tmp_path, INVALID_BRIEF_SHORT_CONTENT)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        # Should have errors or warnings about short content
+        assert len(result.errors) > 0 or len(result.warnings) > 0
+
+    def test_validator_detects_placeholders(self, tmp_path):
         """Test validation detects placeholder text"""
         content_with_placeholders = VALID_PROJECT_BRIEF.replace(
             "Test Project", "[Your Project Name Here]"
         )
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(content_with_placeholders)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert any("placeholder" in warning.lower() for warning in result.warnings)
-
-    def test_validator_checks_overview_fields(self):
-        """Test validation checks for required overview fields"""
-        incomplete_overview = """# Project Brief
-
-## 🎯 Project Overview
-
-**Project Name**: Test
-
----
-
-## 📋 Core Requirements
+        brief_path = _write_brief(tmp_path, content_with_placeholders)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert any("placeholder" in warning.lower() for warning in result.warnings)
 
-Requirements here
-
-## 🏗️ Technical Preferences
-
-Tech
-
-## 👥 User Roles & Permissions
+    def test_validator_checks_overview_fields(self, tmp_path):
+        """Test validation checks for required overview fields"""
+        brief_path = _write_brief(tmp_path, INCOMPLETE_OVERVIEW_BRIEF)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert result.is_valid is False
+        assert any("Brief Description" in error for error in result.errors)
+        assert any("Problem Statement" in error for error in result.errors)
 
-Roles
+    def test_validator_metadata_collection(self, tmp_path):
+        """Test that validator collects metadata"""
+        brief_path = _write_brief(tmp_path, VALID_PROJECT_BRIEF)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
 
-## 🔄 Key User Flows
+        assert "file_size" in result.metadata
+        assert "line_count" in result.metadata
+        assert result.metadata["file_size"] > 0
+        assert result.metadata["line_count"] > 0
 
-Flows
-"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(incomplete_overview)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert result.is_valid is False
-            assert any("Brief Description" in error for error in result.errors)
-            assert any("Problem Statement" in error for error in result.errors)
-
-    def test_validator_metadata_collection(self):
-        """Test that validator collects metadata"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(VALID_PROJECT_BRIEF)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-
-            assert "file_size" in result.metadata
-            assert "line_count" in result.metadata
-            assert result.metadata["file_size"] > 0
-            assert result.metadata["line_count"] > 0
-
-    def test_validator_checklist_detection(self):
+    def test_validator_checklist_detection(self, tmp_path):
         """Test validator detects and analyzes completion checklist"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(VALID_PROJECT_BRIEF)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
+        brief_path = _write_brief(tmp_path, VALID_PROJECT_BRIEF)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
 
-            assert "checklist_progress" in result.metadata
-            assert result.metadata["checklist_progress"]["checked"] > 0
+        assert "checklist_progress" in result.metadata
+        assert result.metadata["checklist_progress"]["checked"] > 0
 
-    def test_validator_unchecked_checklist_warning(self):
+    def test_validator_unchecked_checklist_warning(self, tmp_path):
         """Test validator warns about unchecked checklist items"""
         content_with_unchecked = VALID_PROJECT_BRIEF.replace(
             "- [x] All required sections completed",
             "- [ ] All required sections completed",
         )
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(content_with_unchecked)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert any("unchecked" in warning.lower() for warning in result.warnings)
+        brief_path = _write_brief(tmp_path, content_with_unchecked)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert any("unchecked" in warning.lower() for warning in result.warnings)
 
     @pytest.mark.skip(reason="Empty section validation removed for AI-friendly free text")
-    def test_validator_empty_sections(self):
+    def test_validator_empty_sections(self, tmp_path):
         """Test validator detects empty sections"""
-        content_with_empty_section = """# Project Brief
-
-## 🎯 Project Overview
-
-**Project Name**: Test
-**Brief Description**: Description here that is long enough to pass validation
-**Problem Statement**: Problem statement that is long enough to meet minimum requirements
-**Target Users**: Users
-
-## 📋 Core Requirements
+        brief_path = _write_brief(tmp_path, EMPTY_SECTION_BRIEF)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert any("empty section" in error.lower() for error in result.errors)
 
-## 🏗️ Technical Preferences
-
-Tech
-
-## 👥 User Roles & Permissions
-
-Roles
-
-## 🔄 Key User Flows
-
-Flows
-"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(content_with_empty_section)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert any("empty section" in error.lower() for error in result.errors)
-
-    def test_validator_requirements_subsections(self):
+    def test_validator_requirements_subsections(self, tmp_path):
         """Test validator checks for functional and non-functional requirements"""
-        content_missing_subsections = """# Project Brief
-
-## 🎯 Project Overview
-
-**Project Name**: Test
-**Brief Description**: This is a description that is long enough to pass validation
-**Problem Statement**: This problem statement is long enough to meet minimum requirements for validation
-**Target Users**: Users
-
-## 📋 Core Requirements
-
-Just some generic requirements without proper subsections and organization
-
-## 🏗️ Technical Preferences
-
-Tech
-
-## 👥 User Roles & Permissions
-
-Roles
-
-## 🔄 Key User Flows
-
-Flows
-"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(content_missing_subsections)
-            validator = ProjectBriefValidator(brief_path)
-            result = validator.validate()
-            assert any(
-                "Functional Requirements" in warning for warning in result.warnings
-            )
+        brief_path = _write_brief(tmp_path, MISSING_SUBSECTIONS_BRIEF)
+        validator = ProjectBriefValidator(brief_path)
+        result = validator.validate()
+        assert any(
+            "Functional Requirements" in warning for warning in result.warnings
+        )
 
 
 class TestConvenienceFunctions:
     """Test convenience functions"""
 
     @pytest.mark.skip(reason="Validator logic needs adjustment")
-    def test_validate_project_brief_function(self, temp_dir):
+    def test_validate_project_brief_function(self, tmp_path):
         """Test validate_project_brief convenience function"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(VALID_PROJECT_BRIEF)
-            result = validate_project_brief(brief_path)
-            assert isinstance(result, ValidationResult)
-            assert result.is_valid is True
+        brief_path = _write_brief(tmp_path, VALID_PROJECT_BRIEF)
+        result = validate_project_brief(brief_path)
+        assert isinstance(result, ValidationResult)
+        assert result.is_valid is True
 
     @pytest.mark.skip(reason="Validator logic needs adjustment")
-    def test_validate_or_exit_passes(self, temp_dir):
+    def test_validate_or_exit_passes(self, tmp_path):
         """Test validate_or_exit doesn't exit on valid brief"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(VALID_PROJECT_BRIEF)
-            # Should not raise SystemExit
-            try:
-                validate_or_exit(brief_path)
-            except SystemExit:
-                pytest.fail("validate_or_exit raised SystemExit for valid brief")
-
-    def test_validate_or_exit_fails(self):
+        brief_path = _write_brief(tmp_path, VALID_PROJECT_BRIEF)
+        # Should not raise SystemExit
+        try:
+            validate_or_exit(brief_path)
+        except SystemExit:
+            pytest.fail("validate_or_exit raised SystemExit for valid brief")
+
+    def test_validate_or_exit_fails(self, tmp_path):
         """Test validate_or_exit exits on invalid brief"""
-        with TemporaryDirectory() as tmpdir:
-            brief_path = Path(tmpdir) / "PROJECT_BRIEF.md"
-            brief_path.write_text(INVALID_BRIEF_MISSING_SECTIONS)
-            # Should raise SystemExit
-            with pytest.raises(SystemExit):
-                validate_or_exit(brief_path)
+        brief_path = _write_brief(tmp_path, INVALID_BRIEF_MISSING_SECTIONS)
+        # Should raise SystemExit
+        with pytest.raises(SystemExit):
+            validate_or_exit(brief_path)
 
 
 class TestRealProjectBrief: